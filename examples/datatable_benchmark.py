@@ -0,0 +1,103 @@
+#
+# This file is subject to the terms and conditions defined in the
+# file 'LICENSE', which is part of this source code package.
+#
+# Benchmark DataTable scroll throughput using ThinSliderRender cells vs ThinSliderCell cells.
+#
+import argparse
+import asyncio
+import random
+import time
+
+from rich.console import Console
+from textual.app import ComposeResult, App
+from textual.geometry import Region
+from textual.widgets import DataTable
+
+from src.textual_thin_slider.thinslider import ThinSliderCell, ThinSliderPalette, ThinSliderRender
+
+PALETTE = ThinSliderPalette(stops=((0.0, "green"), (0.6, "yellow"), (0.85, "red")))
+BAR_WIDTH = 14
+
+
+class SliderTableApp(App):
+
+    def __init__(self, rows: int, use_cell: bool) -> None:
+        super().__init__()
+        self.rows = rows
+        self.use_cell = use_cell
+
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_column("Name")
+        table.add_column("Load", width=BAR_WIDTH)
+        table.add_column("Memory", width=BAR_WIDTH)
+        rnd = random.Random(42)
+        renderer = ThinSliderCell if self.use_cell else ThinSliderRender
+        table.add_rows(
+            (f"host-{i}",
+             renderer(range_min=0, range_max=100, value=rnd.randint(0, 100), palette=PALETTE),
+             renderer(range_min=0, range_max=100, value=rnd.randint(0, 100), palette=PALETTE))
+            for i in range(self.rows)
+        )
+
+
+async def run_benchmark(rows: int, pages: int, use_cell: bool) -> float:
+    """
+    Scroll through the table a page at a time, rendering the visible lines after each scroll, and
+    return the number of rows rendered per second.
+    :param rows: Number of rows in the table
+    :param pages: Number of pages to scroll
+    :param use_cell: Use ThinSliderCell renderables instead of ThinSliderRender
+    :return: Rows per second
+    """
+    app = SliderTableApp(rows, use_cell)
+    async with app.run_test(size=(80, 50)) as pilot:
+        table = app.query_one(DataTable)
+        await pilot.pause()
+        region = Region(0, 0, table.size.width, table.size.height)
+        page_height = table.scrollable_content_region.height
+        start = time.perf_counter()
+        for page in range(pages):
+            table.scroll_to(y=page * page_height, animate=False, immediate=True)
+            table.render_lines(region)
+        elapsed = time.perf_counter() - start
+        return (pages * page_height) / elapsed
+
+
+def run_cell_benchmark(cells: int, use_cell: bool) -> float:
+    """
+    Render slider bar cells on their own, without the DataTable, and return the number of cells per second.
+    :param cells: Number of cells to render
+    :param use_cell: Use ThinSliderCell renderables instead of ThinSliderRender
+    :return: Cells per second
+    """
+    console = Console(width=BAR_WIDTH, force_terminal=True)
+    options = console.options.update_width(BAR_WIDTH)
+    rnd = random.Random(42)
+    renderer = ThinSliderCell if use_cell else ThinSliderRender
+    values = [rnd.randint(0, 100) for _ in range(cells)]
+    start = time.perf_counter()
+    for value in values:
+        list(renderer(range_min=0, range_max=100, value=value, palette=PALETTE).__rich_console__(console, options))
+    return cells / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DataTable slider bar scroll benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="number of table rows")
+    parser.add_argument("--pages", type=int, default=200, help="number of pages to scroll")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs, the best run is reported")
+    args = parser.parse_args()
+
+    for label, use_cell in (("ThinSliderRender", False), ("ThinSliderCell", True)):
+        rows_per_sec = max(asyncio.run(run_benchmark(args.rows, args.pages, use_cell)) for _ in range(args.repeat))
+        cells_per_sec = max(run_cell_benchmark(args.rows, use_cell) for _ in range(args.repeat))
+        print(f"{label:>16}: {rows_per_sec:10.0f} table rows/sec {cells_per_sec:12.0f} cells/sec")
+
+
+if __name__ == "__main__":
+    main()
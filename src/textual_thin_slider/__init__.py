@@ -2,10 +2,12 @@
 # This file is subject to the terms and conditions defined in the
 # file 'LICENSE', which is part of this source code package.
 #
-from .thinslider import ThinSlider, ThinSliderDisplayOptions, ThinSliderRender
+from .thinslider import ThinSlider, ThinSliderCell, ThinSliderDisplayOptions, ThinSliderPalette, ThinSliderRender
 
 __all__ = [
     "ThinSlider",
+    "ThinSliderCell",
     "ThinSliderDisplayOptions",
+    "ThinSliderPalette",
     "ThinSliderRender",
 ]
\ No newline at end of file
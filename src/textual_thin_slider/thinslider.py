@@ -7,10 +7,15 @@
 from __future__ import annotations
 
 from enum import IntEnum
+from functools import lru_cache
 from math import ceil
-from typing import Optional, ClassVar, Type
+from typing import Iterable, Optional, ClassVar, Type
 
+from rich.color import Color, ColorType, blend_rgb
 from rich.console import RenderableType, Console, ConsoleOptions, RenderResult
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
 from textual import events
 from textual.binding import Binding
 from textual.geometry import Offset, clamp
@@ -27,17 +32,133 @@ class ThinSliderDisplayOptions(IntEnum):
     show_value = 4
 
 
+class ThinSliderPalette:
+    """
+    Color ramp applied along the slider bar, like a VU meter.
+    Each stop is a (position, color) pair, position is a fraction of the bar from 0.0 to 1.0 and color is any
+    Rich color string. Stops must be in ascending position order. When gradient is False each color fills the
+    band from its position up to the next stop, otherwise colors are blended between stops.
+    Palettes are immutable, they are used as keys for the shared style table cache.
+    """
+    __slots__ = ("_stops", "_gradient", "_colors")
+
+    def __init__(self, stops: Iterable[tuple[float, str]], gradient: bool = False) -> None:
+        """
+        :param stops: Iterable of (position, color) pairs
+        :param gradient: Blend colors between stops instead of using solid bands
+        :raises ValueError: If there are no stops, the stop positions are not ascending or a gradient stop
+            uses the terminal default color
+        :raises ColorParseError: If a stop color is not a valid Rich color
+        """
+        self._stops: tuple[tuple[float, str], ...] = tuple((float(pos), str(color)) for pos, color in stops)
+        self._gradient = bool(gradient)
+
+        if not self._stops:
+            raise ValueError("ThinSliderPalette requires at least one color stop.")
+        positions = [pos for pos, _ in self._stops]
+        if positions != sorted(positions):
+            raise ValueError(f"ThinSliderPalette stop positions must be in ascending order: {positions}.")
+        # Parse colors now so invalid palettes fail where they are created instead of at render time.
+        self._colors: tuple[Color, ...] = tuple(Color.parse(color) for _, color in self._stops)
+        # The default color has no RGB value to blend with.
+        if self._gradient and any(color.type == ColorType.DEFAULT for color in self._colors):
+            raise ValueError("ThinSliderPalette gradient stops can not use the terminal default color.")
+
+    @property
+    def stops(self) -> tuple[tuple[float, str], ...]:
+        """ The (position, color) stops of the palette """
+        return self._stops
+
+    @property
+    def gradient(self) -> bool:
+        """ True if colors are blended between stops """
+        return self._gradient
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ThinSliderPalette):
+            return NotImplemented
+        return self._stops == other._stops and self._gradient == other._gradient
+
+    def __hash__(self) -> int:
+        return hash((self._stops, self._gradient))
+
+    def __repr__(self) -> str:
+        return f"ThinSliderPalette(stops={self._stops!r}, gradient={self._gradient!r})"
+
+    def color_at(self, position: float) -> Color:
+        """
+        Calculate the color of the ramp at the given position.
+        :param position: Fraction of the bar from 0.0 to 1.0
+        :return: Rich Color object
+        """
+        stop_pos, stop_color = self._stops[0][0], self._colors[0]
+        if position <= stop_pos:
+            return stop_color
+
+        for (next_pos, _), next_color in zip(self._stops[1:], self._colors[1:]):
+            if position < next_pos:
+                if not self._gradient:
+                    return stop_color
+                blend = (position - stop_pos) / (next_pos - stop_pos)
+                return Color.from_triplet(blend_rgb(stop_color.get_truecolor(), next_color.get_truecolor(), blend))
+            stop_pos, stop_color = next_pos, next_color
+        return stop_color
+
+
+@lru_cache(maxsize=256)
+def _palette_style_runs(bar_size: int, palette: ThinSliderPalette) -> tuple[tuple[int, int, Style], ...]:
+    """
+    Build the styles for every bar cell once per bar size and palette, adjacent cells sharing the same
+    style are merged into (start, end, style) runs. Results are cached and shared by all sliders.
+    :param bar_size: Number of cells in the slider bar, excluding brackets and display value
+    :param palette: ThinSliderPalette object
+    :return: Tuple of (start, end, style) runs covering the bar
+    """
+    runs = []
+    for i in range(bar_size):
+        # Use the center of each cell so the first and last cells are not biased toward the ramp ends.
+        style = Style(color=palette.color_at((i + 0.5) / bar_size))
+        if runs and runs[-1][2] == style:
+            runs[-1][1] = i + 1
+        else:
+            runs.append([i, i + 1, style])
+    return tuple((start, end, style) for start, end, style in runs)
+
+
 class ThinSliderRender:
     PARTIAL_GLYPHS: ClassVar[list[str]] = ["▉", "▊", "▋", "▌", "▍", "▎", "▏", " "]
     SOLID_GLYPH: ClassVar[str] = "█"
     BLANK_GLYPH: ClassVar[str] = " "
 
     def __init__(self, range_min: int = 0, range_max: int = 100, value: int = 0,
-                 display_type: ThinSliderDisplayOptions = ThinSliderDisplayOptions.none) -> None:
+                 display_type: ThinSliderDisplayOptions = ThinSliderDisplayOptions.none,
+                 palette: ThinSliderPalette | None = None) -> None:
         self.range_min = range_min
         self.range_max = range_max
         self.value = value
         self.display_type = display_type
+        self.palette = palette
+
+    @classmethod
+    def render_display_value(cls, range_min: int, range_max: int, value: int,
+                             display_type: ThinSliderDisplayOptions) -> str:
+        """
+        Format the value or percentage text shown next to the slider bar
+        :param range_min: Minimum range value of the bar
+        :param range_max: Maximum range value of the bar
+        :param value: The current slider position, between min and max
+        :param display_type: ThinSliderValueDisplayEnum value
+        :return: The display value text, empty if no value is displayed
+        """
+        value = min(max(range_min, value), range_max)
+
+        if display_type == ThinSliderDisplayOptions.none:
+            return ''
+        if display_type & ThinSliderDisplayOptions.show_value:
+            return str(value).rjust(len(str(range_max)), cls.BLANK_GLYPH)
+        if (value - range_min) == range_max:
+            return '100%'
+        return f'{round((value - range_min) / (range_max - range_min) * 100):3}%'
 
     @classmethod
     def render_bar(cls, range_min: int, range_max: int, size: int, value: int,
@@ -51,19 +172,8 @@ class ThinSliderRender:
         :param display_type: ThinSliderValueDisplayEnum value
         :return:
         """
-        _, display_left = divmod(display_type, 2)
         value = min(max(range_min, value), range_max)
-
-        if display_type == ThinSliderDisplayOptions.none:
-            display_value = ''
-        else:
-            if display_type & ThinSliderDisplayOptions.show_value:
-                display_value = str(value).rjust(len(str(range_max)), cls.BLANK_GLYPH)
-            else:
-                if (value - range_min) == range_max:
-                    display_value = '100%'
-                else:
-                    display_value = f'{round((value - range_min) / (range_max - range_min) * 100):3}%'
+        display_value = cls.render_display_value(range_min, range_max, value, display_type)
 
         bar_size = (size - len(display_value)) - 2
         glyph_len = len(cls.PARTIAL_GLYPHS)
@@ -89,6 +199,28 @@ class ThinSliderRender:
             return f'{display_value}[{"".join(bar)}]'
         return f'[{"".join(bar)}]{display_value}'
 
+    @classmethod
+    def render_bar_segments(cls, bar: str, palette: ThinSliderPalette) -> list[Segment]:
+        """
+        Split a rendered slider bar into styled segments using the cached palette runs.
+        :param bar: Slider bar string returned from render_bar()
+        :param palette: ThinSliderPalette object
+        :return: List of Segment objects
+        """
+        # Display values never contain brackets, so the brackets mark the bar cells.
+        bar_start = bar.index('[') + 1
+        bar_end = bar.rindex(']')
+        filled_end = bar_start + len(bar[bar_start:bar_end].rstrip(cls.BLANK_GLYPH))
+
+        segments = [Segment(bar[:bar_start])]
+        for start, end, style in _palette_style_runs(bar_end - bar_start, palette):
+            start += bar_start
+            if start >= filled_end:
+                break
+            segments.append(Segment(bar[start:min(end + bar_start, filled_end)], style))
+        segments.append(Segment(bar[filled_end:]))
+        return segments
+
     def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
         size = (options.max_width or console.width)
         bar = self.render_bar(
@@ -98,7 +230,92 @@ class ThinSliderRender:
             value=self.value,
             display_type=self.display_type
         )
-        yield bar
+        if self.palette is None:
+            yield bar
+        else:
+            yield from self.render_bar_segments(bar, self.palette)
+
+
+@lru_cache(maxsize=4096)
+def _render_cell_bar_segments(renderer: type[ThinSliderRender], range_min: int, range_max: int, bar_value: int,
+                              bar_size: int, palette: ThinSliderPalette | None) -> tuple[Segment, ...]:
+    """
+    Render and cache the bracketed bar segments for a slider bar cell, shared by every ThinSliderCell with
+    the same renderer class, range, value bucket, bar size and palette.
+    :param renderer: ThinSliderRender class used to draw the bar glyphs
+    :param range_min: Minimum range value of the bar
+    :param range_max: Maximum range value of the bar
+    :param bar_value: The bucketed value used to draw the bar
+    :param bar_size: Number of bar cells, excluding brackets
+    :param palette: Optional ThinSliderPalette object
+    :return: Tuple of Segment objects
+    """
+    bar = renderer.render_bar(range_min=range_min, range_max=range_max, size=bar_size + 2, value=bar_value,
+                              display_type=ThinSliderDisplayOptions.none)
+    if palette is None:
+        return (Segment(bar),)
+    return tuple(renderer.render_bar_segments(bar, palette))
+
+
+class ThinSliderCell(ThinSliderRender):
+    """
+    A lightweight slider bar renderable for DataTable cells. The bar segments are memoized per value bucket
+    and bar size, so cells showing the same bar reuse them instead of drawing the bar again.
+    """
+    # Number of bar cells used when no width is given
+    DEFAULT_BAR_SIZE: ClassVar[int] = 10
+
+    def __init__(self, range_min: int = 0, range_max: int = 100, value: int = 0,
+                 display_type: ThinSliderDisplayOptions = ThinSliderDisplayOptions.none,
+                 palette: ThinSliderPalette | None = None, width: int | None = None,
+                 buckets: int | None = None) -> None:
+        """
+        :param range_min: The minimum range value of the bar
+        :param range_max: The maximum range value of the bar
+        :param value: The value of the bar
+        :param display_type: Show a value or do not display any value
+        :param palette: Optional color ramp for the bar
+        :param width: The width reported to the DataTable when sizing auto width columns, defaults to the
+            display value, brackets and DEFAULT_BAR_SIZE bar cells
+        :param buckets: Optional number of evenly spaced values to snap the bar to, limits distinct bars.
+            The display value always shows the unsnapped value.
+        :raises ValueError: If buckets is not greater than zero or width leaves no room for the bar
+        """
+        if buckets is not None and buckets <= 0:
+            raise ValueError(f"ThinSliderCell buckets must be greater than zero: {buckets}.")
+        super().__init__(range_min=range_min, range_max=range_max, value=value, display_type=display_type,
+                         palette=palette)
+
+        self.bar_value = min(max(range_min, value), range_max)
+        if buckets and range_max != range_min:
+            bucket_size = (range_max - range_min) / buckets
+            self.bar_value = range_min + int(round(round((self.bar_value - range_min) / bucket_size) * bucket_size))
+
+        self.display_value = self.render_display_value(range_min, range_max, value, display_type)
+        # Display value, brackets and at least one bar cell
+        self.min_width = len(self.display_value) + 3
+        if width is None:
+            width = len(self.display_value) + 2 + self.DEFAULT_BAR_SIZE
+        elif width < self.min_width:
+            raise ValueError(f"ThinSliderCell width must be at least {self.min_width} to fit the bar: {width}.")
+        self.width = width
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        # Only draw wider than the cell when there is no room for a single bar cell.
+        width = max(options.max_width or console.width, self.min_width)
+        bar = _render_cell_bar_segments(type(self), self.range_min, self.range_max, self.bar_value,
+                                        width - len(self.display_value) - 2, self.palette)
+        if not self.display_value:
+            yield from bar
+        elif self.display_type & ThinSliderDisplayOptions.display_left:
+            yield Segment(self.display_value)
+            yield from bar
+        else:
+            yield from bar
+            yield Segment(self.display_value)
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement(self.width, self.width)
 
 
 class ThinSlider(Widget, can_focus=True):
@@ -157,13 +374,14 @@ class ThinSlider(Widget, can_focus=True):
     def __init__(self, range_min: int, range_max: int,
                  display_type: ThinSliderDisplayOptions = ThinSliderDisplayOptions.none, step: int = 1,
                  value: int | None = None, name: str | None = None, id: str | None = None, classes: str | None = None,
-                 disabled: bool = False) -> None:
+                 disabled: bool = False, palette: ThinSliderPalette | None = None) -> None:
         """
         :param range_min: The minimum range value of the slider
         :param range_max: The maximum range value of the slider
         :param display_type: Show a value or do not display any value
         :param step: The step size for each movement of the slider
         :param value: The initial value of the slider
+        :param palette: Optional color ramp for the slider bar
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled, markup=False)
         self.min = range_min
@@ -171,6 +389,7 @@ class ThinSlider(Widget, can_focus=True):
         self.step = step
         self.value = value if value is not None else range_min
         self.display_type = display_type
+        self.palette = palette
 
         if display_type == ThinSliderDisplayOptions.none:
             self.display_value_len = 0
@@ -204,11 +423,20 @@ class ThinSlider(Widget, can_focus=True):
 
     def render(self) -> RenderableType:
         """ Render the slider bar """
+        if self.palette is None:
+            # Keep the original call signature so custom renderer classes without palette support still work.
+            return self.renderer(
+                range_min=self.min,
+                range_max=self.max,
+                value=self.value,
+                display_type=self.display_type
+            )
         return self.renderer(
             range_min=self.min,
             range_max=self.max,
             value=self.value,
-            display_type=self.display_type
+            display_type=self.display_type,
+            palette=self.palette
         )
 
     def _calc_bar_min_max_positions(self, display_left: int, width: int) -> tuple[int, int]:
@@ -5,7 +5,7 @@
 import pytest
 from textual.app import ComposeResult, App
 
-from src.textual_thin_slider.thinslider import ThinSlider, ThinSliderDisplayOptions
+from src.textual_thin_slider.thinslider import ThinSlider, ThinSliderDisplayOptions, ThinSliderPalette, ThinSliderRender
 
 
 class TestThinSlider(ThinSlider):
@@ -115,4 +115,52 @@ async def test_slider_message_events():
         assert app.event is not None
         control = app.event.control
         assert control is not None
-        assert control.percent > 0.0
\ No newline at end of file
+        assert control.percent > 0.0
+
+
+class PaletteSliderApp(App):
+
+    palette = ThinSliderPalette(stops=((0.0, "green"), (0.5, "red")))
+
+    def compose(self) -> ComposeResult:
+        yield TestThinSlider(id="slider-1", range_min=0, range_max=79, value=79, palette=self.palette)
+
+
+class LegacyRender(ThinSliderRender):
+    """ A custom renderer using the original ThinSliderRender signature without palette support """
+    def __init__(self, range_min: int, range_max: int, value: int, display_type: ThinSliderDisplayOptions) -> None:
+        super().__init__(range_min=range_min, range_max=range_max, value=value, display_type=display_type)
+
+
+class LegacyThinSlider(TestThinSlider):
+    renderer = LegacyRender
+
+
+class LegacySliderApp(App):
+
+    def compose(self) -> ComposeResult:
+        yield LegacyThinSlider(id="slider-1", range_min=0, range_max=79, value=40)
+
+
+@pytest.mark.asyncio
+async def test_slider_palette_render():
+    """ Test the slider widget renders the bar using the palette colors """
+    app = PaletteSliderApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        obj = app.get_child_by_type(TestThinSlider)
+        segments = list(obj.render_line(0))
+        assert ''.join(segment.text for segment in segments) == '[████████]'
+        bar_colors = [segment.style.color.name for segment in segments if segment.text.strip('[]')]
+        assert bar_colors == ['green', 'red']
+
+
+@pytest.mark.asyncio
+async def test_slider_legacy_renderer():
+    """ Test custom renderer classes without palette support still render when no palette is set """
+    app = LegacySliderApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        obj = app.get_child_by_type(LegacyThinSlider)
+        assert isinstance(obj.render(), LegacyRender)
+        assert ''.join(segment.text for segment in obj.render_line(0)) == '[████    ]'
@@ -3,7 +3,16 @@
 # file 'LICENSE', which is part of this source code package.
 #
 
-from src.textual_thin_slider.thinslider import ThinSliderRender, ThinSliderDisplayOptions
+import pytest
+from rich.color import Color, ColorParseError
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
+from textual.app import ComposeResult, App
+from textual.widgets import DataTable
+
+from src.textual_thin_slider.thinslider import (_render_cell_bar_segments, ThinSliderCell, ThinSliderRender,
+                                                ThinSliderDisplayOptions, ThinSliderPalette)
 
 
 class RendererOptions:
@@ -194,3 +203,222 @@ def test_renderer_block_sliding():
     obj.value = 17
     result = next(obj.__rich_console__(RendererConsole(), RendererOptions()))
     assert result == f'[{ThinSliderRender.SOLID_GLYPH}{ThinSliderRender.SOLID_GLYPH}▏               ]'
+
+
+def test_renderer_palette_thresholds():
+    """ Test palette threshold bands are applied to the filled cells of the bar """
+    palette = ThinSliderPalette(stops=((0.0, "green"), (0.5, "yellow"), (0.75, "red")))
+    obj = ThinSliderRender(range_min=0, range_max=100, value=100, palette=palette)
+    segments = list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+    assert all(isinstance(segment, Segment) for segment in segments)
+    assert ''.join(segment.text for segment in segments) == '[██████████████████]'
+    assert [(segment.text, segment.style) for segment in segments] == [
+        ('[', None),
+        ('█████████', Style(color="green")),
+        ('████', Style(color="yellow")),
+        ('█████', Style(color="red")),
+        (']', None),
+    ]
+
+    # Only the filled cells are colored, the styles for the empty part of the bar are not emitted.
+    obj.value = 50
+    segments = list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+    assert [(segment.text, segment.style) for segment in segments] == [
+        ('[', None),
+        ('█████████', Style(color="green")),
+        ('         ]', None),
+    ]
+
+
+def test_renderer_palette_display_value():
+    """ Test palette coloring leaves the display value unstyled """
+    palette = ThinSliderPalette(stops=((0.0, "green"), (0.5, "red")))
+    obj = ThinSliderRender(range_min=0, range_max=100, value=50, palette=palette,
+                           display_type=ThinSliderDisplayOptions.display_left)
+    segments = list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+    assert [(segment.text, segment.style) for segment in segments] == [
+        (' 50%[', None),
+        ('███████', Style(color="green")),
+        ('       ]', None),
+    ]
+
+
+def test_renderer_palette_gradient():
+    """ Test gradient palettes blend colors between stops """
+    palette = ThinSliderPalette(stops=((0.0, "#000000"), (1.0, "#ffffff")), gradient=True)
+    obj = ThinSliderRender(range_min=0, range_max=100, value=100, palette=palette)
+    segments = list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+    colors = [segment.style.color.get_truecolor() for segment in segments[1:-1]]
+    assert len(colors) == 18
+    assert colors == sorted(colors)
+    assert colors[0].red < 16 and colors[-1].red > 240
+
+
+def test_renderer_palette_style_table_shared():
+    """ Test the palette style table is built once and shared between renderers """
+    palette = ThinSliderPalette(stops=((0.0, "green"), (0.6, "yellow"), (0.85, "red")))
+    first = ThinSliderRender(range_min=0, range_max=100, value=100, palette=palette)
+    second = ThinSliderRender(range_min=0, range_max=500, value=320, palette=palette)
+    first_segments = list(first.__rich_console__(RendererConsole(), RendererOptions()))
+    second_segments = list(second.__rich_console__(RendererConsole(), RendererOptions()))
+    assert first_segments[1].style is second_segments[1].style
+
+
+def test_palette_validation():
+    """ Test palettes normalize their stops and reject invalid stops when created """
+    palette = ThinSliderPalette(stops=[(0, "green"), [0.5, "red"]])
+    assert palette.stops == ((0.0, "green"), (0.5, "red"))
+    assert palette == ThinSliderPalette(stops=((0.0, "green"), (0.5, "red")))
+    assert hash(palette) == hash(ThinSliderPalette(stops=((0.0, "green"), (0.5, "red"))))
+
+    with pytest.raises(ValueError):
+        ThinSliderPalette(stops=())
+    with pytest.raises(ValueError):
+        ThinSliderPalette(stops=((0.5, "green"), (0.0, "red")))
+    with pytest.raises(ColorParseError):
+        ThinSliderPalette(stops=((0.0, "not-a-color"),))
+    # The terminal default color can not be blended
+    with pytest.raises(ValueError):
+        ThinSliderPalette(stops=((0.0, "color(1)"), (1.0, "default")), gradient=True)
+    assert ThinSliderPalette(stops=((0.0, "color(1)"), (1.0, "default"))).gradient is False
+
+
+def test_palette_immutable():
+    """ Test palettes can not be changed after creation, they are used as style table cache keys """
+    palette = ThinSliderPalette(stops=((0.0, "green"), (0.5, "red")))
+    with pytest.raises(AttributeError):
+        palette.stops = ((0.0, "red"),)
+    with pytest.raises(AttributeError):
+        palette.gradient = True
+    with pytest.raises(AttributeError):
+        palette.colors = ()
+    assert palette.color_at(0.0) == Color.parse("green")
+
+
+def test_cell_renderer_output():
+    """ Test the cell renderer output matches the slider renderer output """
+    obj = ThinSliderCell(range_min=0, range_max=100, value=50, display_type=ThinSliderDisplayOptions.display_right)
+    assert isinstance(obj, ThinSliderRender)
+    segments = list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+    assert segments == [Segment('[███████       ]'), Segment(' 50%')]
+
+    obj = ThinSliderCell(range_min=0, range_max=100, value=50, display_type=ThinSliderDisplayOptions.display_left)
+    segments = list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+    assert segments == [Segment(' 50%'), Segment('[███████       ]')]
+
+    palette = ThinSliderPalette(stops=((0.0, "green"), (0.5, "red")))
+    obj = ThinSliderCell(range_min=0, range_max=100, value=100, palette=palette)
+    expected = list(ThinSliderRender(range_min=0, range_max=100, value=100, palette=palette).__rich_console__(
+        RendererConsole(), RendererOptions()))
+    assert list(obj.__rich_console__(RendererConsole(), RendererOptions())) == expected
+
+
+def test_cell_renderer_memoized():
+    """ Test cells with the same value bucket and width reuse the same rendered segments """
+    first = ThinSliderCell(range_min=0, range_max=1000, value=503, buckets=100)
+    second = ThinSliderCell(range_min=0, range_max=1000, value=497, buckets=100)
+    assert first.value == 503 and second.value == 497
+    assert first.bar_value == second.bar_value == 500
+
+    first_segments = list(first.__rich_console__(RendererConsole(), RendererOptions()))
+    second_segments = list(second.__rich_console__(RendererConsole(), RendererOptions()))
+    assert first_segments[0] is second_segments[0]
+
+
+def test_cell_renderer_memoized_with_labels():
+    """ Test bucketed cells showing different labels still share the cached bar segments """
+    display_type = ThinSliderDisplayOptions.display_right | ThinSliderDisplayOptions.show_value
+    _render_cell_bar_segments.cache_clear()
+    for value in range(40000, 60000, 7):
+        obj = ThinSliderCell(range_min=0, range_max=100000, value=value, buckets=50, display_type=display_type)
+        list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+
+    cache_info = _render_cell_bar_segments.cache_info()
+    # Values 40,000 to 59,999 fall into 11 buckets of 2,000
+    assert cache_info.misses == 11
+    assert cache_info.hits == len(range(40000, 60000, 7)) - 11
+
+
+def test_cell_renderer_bucket_labels():
+    """ Test bucketed cells draw the snapped bar but label the real value """
+    obj = ThinSliderCell(range_min=0, range_max=1000, value=503, buckets=100,
+                         display_type=ThinSliderDisplayOptions.display_right | ThinSliderDisplayOptions.show_value)
+    segments = list(obj.__rich_console__(RendererConsole(), RendererOptions()))
+    assert segments == [Segment('[███████       ]'), Segment(' 503')]
+
+    with pytest.raises(ValueError):
+        ThinSliderCell(range_min=0, range_max=100, value=50, buckets=0)
+    # A zero range has nothing to snap
+    obj = ThinSliderCell(range_min=10, range_max=10, value=10, buckets=10)
+    assert obj.bar_value == 10
+
+
+def test_cell_renderer_subclass_glyphs():
+    """ Test cell subclasses with their own glyphs do not share cached bars with the base class """
+    class AsciiSliderCell(ThinSliderCell):
+        PARTIAL_GLYPHS = ["=", "=", "=", "-", "-", "-", "-", " "]
+        SOLID_GLYPH = "#"
+
+    base = list(ThinSliderCell(range_min=0, range_max=100, value=100).__rich_console__(
+        RendererConsole(), RendererOptions()))
+    custom = list(AsciiSliderCell(range_min=0, range_max=100, value=100).__rich_console__(
+        RendererConsole(), RendererOptions()))
+    assert base == [Segment('[██████████████████]')]
+    assert custom == [Segment('[##################]')]
+
+
+def test_cell_renderer_measure():
+    """ Test the cell renderer reports its width for DataTable auto width columns """
+    obj = ThinSliderCell(range_min=0, range_max=100, value=50, width=16)
+    assert obj.__rich_measure__(RendererConsole(), RendererOptions()) == Measurement(16, 16)
+
+    # The default width fits the display value, brackets and the default bar size
+    obj = ThinSliderCell(range_min=0, range_max=100, value=50, display_type=ThinSliderDisplayOptions.display_right)
+    assert obj.width == 4 + 2 + ThinSliderCell.DEFAULT_BAR_SIZE
+
+    # An explicit width is kept as long as the bar has at least one cell
+    obj = ThinSliderCell(range_min=0, range_max=100, value=72, width=10,
+                         display_type=ThinSliderDisplayOptions.display_right)
+    assert obj.__rich_measure__(RendererConsole(), RendererOptions()) == Measurement(10, 10)
+    options = RendererOptions()
+    options.max_width = 10
+    assert ''.join(segment.text for segment in obj.__rich_console__(RendererConsole(), options)) == '[██▉ ] 72%'
+    with pytest.raises(ValueError):
+        ThinSliderCell(range_min=0, range_max=100, value=72, width=6,
+                       display_type=ThinSliderDisplayOptions.display_right)
+
+    # Cells narrower than the display value draw a single bar cell instead of failing
+    options.max_width = 3
+    obj = ThinSliderCell(range_min=0, range_max=1000000, value=50,
+                         display_type=ThinSliderDisplayOptions.display_left | ThinSliderDisplayOptions.show_value)
+    text = ''.join(segment.text for segment in obj.__rich_console__(RendererConsole(), options))
+    assert len(text) == obj.min_width
+
+
+class CellTableApp(App):
+
+    def compose(self) -> ComposeResult:
+        yield DataTable()
+
+    def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.add_column("Host", key="host")
+        table.add_column("Load", key="load")
+        table.add_row("host-1", ThinSliderCell(range_min=0, range_max=100, value=50, width=16,
+                                               display_type=ThinSliderDisplayOptions.display_right))
+        table.add_row("host-2", ThinSliderCell(range_min=0, range_max=100, value=100, width=16,
+                                               display_type=ThinSliderDisplayOptions.display_right))
+
+
+@pytest.mark.asyncio
+async def test_cell_renderer_data_table():
+    """ Test cell renderers size auto width DataTable columns and render inside the table """
+    app = CellTableApp()
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        table = app.query_one(DataTable)
+        assert table.columns["load"].content_width == 16
+
+        lines = [''.join(segment.text for segment in table.render_line(y)) for y in range(1, 3)]
+        assert '[█████     ] 50%' in lines[0]
+        assert '[██████████]100%' in lines[1]